@@ -1,10 +1,20 @@
-from typing import Dict, Any, List
+from functools import lru_cache
+from typing import Annotated, List, Literal
 import os
 import tempfile
+import threading
+from pathlib import Path
 
 import fastapi
-import pandas as pd
-from google.cloud import aiplatform
+import google.auth
+from google.auth.transport.requests import AuthorizedSession
+from requests.adapters import HTTPAdapter
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse
+from pydantic import BaseModel, Field
+from google.cloud import aiplatform_v1
+from google.protobuf import field_mask_pb2
 from google.cloud import storage
 
 from challenge.model import DelayModel
@@ -31,6 +41,7 @@ app = fastapi.FastAPI(
     2. Receive predictions: 0 (no delay) or 1 (delay expected)
     """,
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     contact={
         "name": "ML Engineering Team",
         "email": "ml-team@example.com",
@@ -39,12 +50,84 @@ app = fastapi.FastAPI(
         "name": "MIT",
     },
 )
-_model = DelayModel()
 
 
-@app.on_event("startup")
-async def load_model_on_startup() -> None:
-    """Load model from Vertex AI Model Registry on startup."""
+def _load_baked_model() -> DelayModel:
+    """
+    Load the model baked into the image at `MODEL_PATH`, if there is one.
+
+    Setting `MODEL_PATH` to an empty string skips the baked model so the
+    latest version is always loaded from Vertex AI Model Registry.
+
+    This runs at import time so that, with gunicorn `--preload`, the model is
+    loaded once in the master process and its memory-mapped weights are
+    shared copy-on-write by every forked worker.
+    """
+    model = DelayModel()
+    model_path = os.getenv("MODEL_PATH", "model.pkl")
+    if model_path and Path(model_path).is_file():
+        try:
+            model.load_model(model_path)
+            print(f"✓ Model loaded successfully from {model_path}")
+        except Exception as e:
+            print(f"Warning: Could not load model from {model_path}: {e}")
+    return model
+
+
+_model = _load_baked_model()
+_model_lock = threading.Lock()
+
+
+class Flight(BaseModel):
+    """A flight to predict a delay for."""
+    OPERA: Literal[DelayModel.OPERATORS]
+    TIPOVUELO: Literal[DelayModel.FLIGHT_TYPES]
+    MES: Annotated[int, Field(ge=1, le=12)]
+
+
+class PredictRequest(BaseModel):
+    """Batch of flights sent to `/predict`."""
+    flights: List[Flight]
+
+
+@app.exception_handler(RequestValidationError)
+async def validation_exception_handler(
+    request: fastapi.Request,
+    exc: RequestValidationError
+) -> ORJSONResponse:
+    """
+    Reject invalid payloads with 400, as the API contract expects.
+
+    Pydantic validates the whole batch in one pass, so every invalid field
+    of every flight is reported together in a single response.
+    """
+    return ORJSONResponse(status_code=400, content={"detail": jsonable_encoder(exc.errors())})
+
+
+@lru_cache(maxsize=None)
+def _get_storage_client(project_id: str) -> storage.Client:
+    """
+    Return a shared GCS client backed by a pooled HTTP session.
+
+    The client is thread-safe, so it is built once per project and reused
+    for every blob operation instead of paying a new TLS handshake each time.
+    """
+    credentials, _ = google.auth.default(scopes=storage.Client.SCOPE)
+    session = AuthorizedSession(credentials)
+    session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=16))
+    return storage.Client(project=project_id, credentials=credentials, _http=session)
+
+
+def _swap_model(model: DelayModel) -> None:
+    """Publish a loaded model; requests pick it up with a plain reference read."""
+    global _model
+    with _model_lock:
+        _model = model
+
+
+def _load_and_swap_model() -> None:
+    """Download the latest model from Vertex AI Model Registry and swap it in."""
+    model = DelayModel()
     project_id = os.getenv("GCP_PROJECT_ID")
     location = os.getenv("GCP_LOCATION")
     model_name = os.getenv("VERTEX_MODEL_NAME")
@@ -54,24 +137,27 @@ async def load_model_on_startup() -> None:
         return
     
     try:
-        # Initialize Vertex AI
-        aiplatform.init(project=project_id, location=location)
-        
-        # Get the latest version of the model
-        models = aiplatform.Model.list(
+        # Get only the latest version of the model, with just the fields we need
+        model_client = aiplatform_v1.ModelServiceClient(
+            client_options={"api_endpoint": f"{location}-aiplatform.googleapis.com"}
+        )
+        request = aiplatform_v1.ListModelsRequest(
+            parent=f"projects/{project_id}/locations/{location}",
             filter=f'display_name="{model_name}"',
-            order_by="create_time desc"
+            order_by="create_time desc",
+            page_size=1,
+            read_mask=field_mask_pb2.FieldMask(paths=["name", "artifact_uri"])
         )
+        latest_model = next(iter(model_client.list_models(request=request).models), None)
         
-        if not models:
+        if latest_model is None:
             print(f"No model found with name '{model_name}', using untrained model")
             return
         
-        latest_model = models[0]
-        print(f"Found model: {latest_model.resource_name}")
+        print(f"Found model: {latest_model.name}")
         
         # Extract GCS path from model artifact URI
-        artifact_uri = latest_model.gca_resource.artifact_uri
+        artifact_uri = latest_model.artifact_uri
         print(f"Artifact URI: {artifact_uri}")
         
         # Download model.pkl from GCS
@@ -79,7 +165,7 @@ async def load_model_on_startup() -> None:
         bucket_name = artifact_uri.split("/")[2]
         blob_path = "/".join(artifact_uri.split("/")[3:]) + "model.pkl"
         
-        storage_client = storage.Client(project=project_id)
+        storage_client = _get_storage_client(project_id)
         bucket = storage_client.bucket(bucket_name)
         blob = bucket.blob(blob_path)
         
@@ -89,7 +175,8 @@ async def load_model_on_startup() -> None:
             print(f"Downloaded model to {tmp_file.name}")
             
             # Load into DelayModel
-            _model.load_model(tmp_file.name)
+            model.load_model(tmp_file.name)
+            _swap_model(model)
             print("✓ Model loaded successfully from Vertex AI Model Registry")
             
     except Exception as e:
@@ -97,6 +184,18 @@ async def load_model_on_startup() -> None:
         print("Continuing with untrained model (will return default predictions)")
 
 
+@app.on_event("startup")
+async def load_model_on_startup() -> None:
+    """
+    Start downloading the model in a background thread, unless one was baked in.
+
+    Blocking IO stays off the event loop, so `/health` is live right away
+    and `/predict` returns default predictions until the model is swapped in.
+    """
+    if _model._model is None:
+        threading.Thread(target=_load_and_swap_model, daemon=True).start()
+
+
 @app.get(
     "/health",
     status_code=200,
@@ -113,29 +212,6 @@ async def get_health() -> dict:
     return {"status": "OK"}
 
 
-def _validate(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
-    if "flights" not in payload or not isinstance(payload["flights"], list):
-        raise fastapi.HTTPException(status_code=400)
-    valid_ops = {
-        "Aerolineas Argentinas",
-        "Grupo LATAM",
-        "Sky Airline",
-        "Copa Air",
-        "Latin American Wings",
-    }
-    rows: List[Dict[str, Any]] = []
-    for f in payload["flights"]:
-        if not all(k in f for k in ("OPERA", "TIPOVUELO", "MES")):
-            raise fastapi.HTTPException(status_code=400)
-        opera = f["OPERA"]
-        tipo = f["TIPOVUELO"]
-        mes = f["MES"]
-        if opera not in valid_ops or tipo not in {"I", "N"} or not (1 <= int(mes) <= 12):
-            raise fastapi.HTTPException(status_code=400)
-        rows.append({"OPERA": opera, "TIPOVUELO": tipo, "MES": int(mes)})
-    return rows
-
-
 @app.post(
     "/predict",
     status_code=200,
@@ -144,7 +220,7 @@ def _validate(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
     tags=["Predictions"]
 )
 async def post_predict(
-    payload: Dict[str, Any] = fastapi.Body(
+    payload: PredictRequest = fastapi.Body(
         ...,
         example={
             "flights": [
@@ -156,7 +232,7 @@ async def post_predict(
             ]
         }
     )
-) -> dict:
+) -> ORJSONResponse:
     """
     Predict flight delays based on flight information.
     
@@ -166,8 +242,11 @@ async def post_predict(
     
     Returns a list of predictions where 0=no delay, 1=delay expected.
     """
-    rows = _validate(payload)
-    df = pd.DataFrame(rows)
-    features = _model.preprocess(df)
-    predictions = _model.predict(features)
-    return {"predict": predictions}
\ No newline at end of file
+    flights = payload.flights
+    predictions = _model.predict_fast_batch(
+        opera=[flight.OPERA for flight in flights],
+        tipo=[flight.TIPOVUELO for flight in flights],
+        mes=[flight.MES for flight in flights]
+    )
+    # Returned as a response directly so orjson serializes the array natively
+    return ORJSONResponse({"predict": predictions})
\ No newline at end of file
@@ -1,9 +1,9 @@
 import pandas as pd
 import numpy as np
-import pickle
-from datetime import datetime
+import itertools
+import joblib
 from pathlib import Path
-from typing import Tuple, Union, List
+from typing import Sequence, Tuple, Union, List
 from sklearn.linear_model import LogisticRegression
 
 
@@ -30,9 +30,35 @@ class DelayModel:
         "OPERA_Copa Air"
     ]
     
+    # (source column, value) pair that each of the top 10 features encodes
+    _FEATURE_SOURCES = [
+        (column, int(value) if column == "MES" else value)
+        for column, value in (feature.split("_", 1) for feature in TOP_10_FEATURES)
+    ]
+    
+    # Column position of each (source column, value) pair in the feature matrix
+    _FEATURE_INDEX = {source: j for j, source in enumerate(_FEATURE_SOURCES)}
+    
+    # Values accepted for the categorical inputs when serving predictions
+    OPERATORS = (
+        "Aerolineas Argentinas",
+        "Grupo LATAM",
+        "Sky Airline",
+        "Copa Air",
+        "Latin American Wings"
+    )
+    FLIGHT_TYPES = ("I", "N")
+    
+    # Position of each accepted value along the lookup table axes
+    _OPERA_INDEX = {opera: i for i, opera in enumerate(OPERATORS)}
+    _TIPO_INDEX = {tipo: i for i, tipo in enumerate(FLIGHT_TYPES)}
+    
     def __init__(self):
         """Initialize the DelayModel with a Logistic Regression model."""
         self._model = None  # Model should be saved in this attribute.
+        self._coef = None  # Cached weights for the NumPy predict path.
+        self._intercept = None
+        self._lut = None  # Prediction for every (OPERA, TIPOVUELO, MES) input.
 
     def preprocess(
         self,
@@ -51,27 +77,19 @@ class DelayModel:
             or
             pd.DataFrame: features.
         """
-        # Create a copy to avoid modifying the original data
-        data = data.copy()
-        
-        # Generate the delay target if needed for training
+        # Generate the delay target if needed for training, on a copy to avoid
+        # modifying the original data (serving only reads the input columns)
         if target_column:
+            data = data.copy()
             data['delay'] = self._generate_delay_target(data)
         
-        # Create one-hot encoded features
-        features = pd.concat([
-            pd.get_dummies(data['OPERA'], prefix='OPERA'),
-            pd.get_dummies(data['TIPOVUELO'], prefix='TIPOVUELO'),
-            pd.get_dummies(data['MES'], prefix='MES')
-        ], axis=1)
-        
-        # Ensure all top 10 features exist (add missing columns with zeros)
-        for feature in self.TOP_10_FEATURES:
-            if feature not in features.columns:
-                features[feature] = 0
-        
-        # Select only the top 10 features
-        features = features[self.TOP_10_FEATURES]
+        # One-hot encode only the top 10 features, straight from the source columns
+        encoded = self.preprocess_arrays(
+            opera=data['OPERA'].to_numpy(),
+            tipo=data['TIPOVUELO'].to_numpy(),
+            mes=data['MES'].to_numpy()
+        )
+        features = pd.DataFrame(encoded, columns=self.TOP_10_FEATURES, index=data.index)
         
         # Return features and target if target_column is specified
         if target_column:
@@ -83,6 +101,37 @@ class DelayModel:
         
         return features
     
+    def preprocess_arrays(
+        self,
+        opera: Sequence[str],
+        tipo: Sequence[str],
+        mes: Sequence[int]
+    ) -> np.ndarray:
+        """
+        One-hot encode the top 10 features from columnar flight data.
+
+        Each feature column is filled by a single vectorized comparison of
+        its source column, so no row-wise work or DataFrame is involved.
+
+        Args:
+            opera (Sequence[str]): airline operator of each flight.
+            tipo (Sequence[str]): flight type of each flight.
+            mes (Sequence[int]): month of each flight.
+
+        Returns:
+            np.ndarray: int8 features, with columns ordered as `TOP_10_FEATURES`.
+        """
+        columns = {
+            'OPERA': np.asarray(opera),
+            'TIPOVUELO': np.asarray(tipo),
+            'MES': np.asarray(mes).astype(int)
+        }
+        features = np.empty((len(columns['MES']), len(self.TOP_10_FEATURES)), dtype=np.int8)
+        for (column, value), j in self._FEATURE_INDEX.items():
+            features[:, j] = columns[column] == value
+        
+        return features
+    
     def _generate_delay_target(self, data: pd.DataFrame) -> pd.Series:
         """
         Generate the delay target variable.
@@ -96,22 +145,16 @@ class DelayModel:
         Returns:
             pd.Series: binary delay indicator (1 = delayed, 0 = not delayed)
         """
-        def calculate_min_diff(row):
-            """Calculate the difference in minutes between scheduled and actual departure."""
-            try:
-                fecha_o = datetime.strptime(row['Fecha-O'], '%Y-%m-%d %H:%M:%S')
-                fecha_i = datetime.strptime(row['Fecha-I'], '%Y-%m-%d %H:%M:%S')
-                min_diff = ((fecha_o - fecha_i).total_seconds()) / 60
-                return min_diff
-            except:
-                return 0
+        # Parse both timestamps in vectorized passes; unparseable values become NaT
+        fecha_o = pd.to_datetime(data['Fecha-O'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
+        fecha_i = pd.to_datetime(data['Fecha-I'], format='%Y-%m-%d %H:%M:%S', errors='coerce')
         
-        # Calculate minute differences
-        data['min_diff'] = data.apply(calculate_min_diff, axis=1)
+        # Calculate minute differences (rows that failed to parse count as 0)
+        min_diff = np.nan_to_num((fecha_o - fecha_i).dt.total_seconds().to_numpy() / 60.0)
         
         # Define threshold and create binary delay indicator
         threshold_in_minutes = 15
-        delay = np.where(data['min_diff'] > threshold_in_minutes, 1, 0)
+        delay = (min_diff > threshold_in_minutes).astype(np.int8)
         
         return pd.Series(delay, index=data.index)
 
@@ -134,10 +177,10 @@ class DelayModel:
         if isinstance(target, pd.DataFrame):
             target = target.iloc[:, 0]
         
-        # Calculate class weights for balancing
-        n_y0 = (target == 0).sum()
-        n_y1 = (target == 1).sum()
-        class_weight = {1: n_y0 / len(target), 0: n_y1 / len(target)}
+        # Calculate class weights for balancing in a single pass over the target
+        counts = np.bincount(target.to_numpy().astype(np.int8), minlength=2)
+        n_total = counts.sum()
+        class_weight = {1: counts[0] / n_total, 0: counts[1] / n_total}
         
         # Initialize and train the Logistic Regression model with class balancing
         self._model = LogisticRegression(
@@ -147,16 +190,18 @@ class DelayModel:
         )
         
         self._model.fit(features, target)
+        self._cache_weights()
+        self._build_lookup_table()
 
     def predict(
         self,
-        features: pd.DataFrame
+        features: Union[pd.DataFrame, np.ndarray]
     ) -> List[int]:
         """
         Predict delays for new flights.
 
         Args:
-            features (pd.DataFrame): preprocessed data.
+            features (pd.DataFrame | np.ndarray): preprocessed data.
         
         Returns:
             (List[int]): predicted targets.
@@ -165,6 +210,12 @@ class DelayModel:
             # Return default predictions (no delay) if model not trained
             return [0] * len(features)
         
+        # Preprocessed arrays skip sklearn's per-call overhead: the binary
+        # logistic regression decision is just the sign of a dot product
+        if isinstance(features, np.ndarray):
+            scores = features @ self._coef + self._intercept
+            return (scores > 0).astype(np.int8).tolist()
+        
         # Make predictions
         predictions = self._model.predict(features)
         
@@ -187,8 +238,8 @@ class DelayModel:
         filepath_obj = Path(filepath)
         filepath_obj.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(filepath, 'wb') as f:
-            pickle.dump(self._model, f)
+        # Uncompressed so that load_model can memory-map the weight arrays
+        joblib.dump(self._model, filepath, compress=0)
     
     def load_model(self, filepath: str = "model.pkl") -> None:
         """
@@ -203,5 +254,67 @@ class DelayModel:
         if not Path(filepath).exists():
             raise FileNotFoundError(f"Model file not found: {filepath}")
         
-        with open(filepath, 'rb') as f:
-            self._model = pickle.load(f)
\ No newline at end of file
+        # Weights are memory-mapped read-only, so forked workers share them
+        self._model = joblib.load(filepath, mmap_mode='r')
+        self._cache_weights()
+        self._build_lookup_table()
+    
+    def _cache_weights(self) -> None:
+        """Cache the trained coefficients as plain NumPy values for predict."""
+        self._coef = self._model.coef_.ravel().astype(np.float32)
+        self._intercept = float(self._model.intercept_[0])
+    
+    def _build_lookup_table(self) -> None:
+        """
+        Precompute the prediction for every valid flight.
+
+        The input domain is only 5 operators x 2 flight types x 12 months,
+        so all 120 predictions are computed once and `predict_fast` becomes
+        a table lookup.
+        """
+        opera, tipo, mes = zip(*itertools.product(self._OPERA_INDEX, self._TIPO_INDEX, range(1, 13)))
+        features = self.preprocess_arrays(opera=opera, tipo=tipo, mes=mes)
+        predictions = np.array(self.predict(features), dtype=np.int8)
+        self._lut = predictions.reshape(len(self._OPERA_INDEX), len(self._TIPO_INDEX), 12)
+    
+    def predict_fast(self, opera: str, tipo: str, mes: int) -> int:
+        """
+        Predict the delay of a single, already validated flight.
+
+        Args:
+            opera (str): airline operator.
+            tipo (str): flight type ('I' or 'N').
+            mes (int): month (1-12).
+
+        Returns:
+            int: predicted target.
+        """
+        return int(self.predict_fast_batch(opera=[opera], tipo=[tipo], mes=[mes])[0])
+    
+    def predict_fast_batch(
+        self,
+        opera: Sequence[str],
+        tipo: Sequence[str],
+        mes: Sequence[int]
+    ) -> np.ndarray:
+        """
+        Predict the delays of a batch of already validated flights.
+
+        All flights are resolved with a single fancy-indexing lookup into
+        the prediction table, so the per-call overhead is paid once per batch.
+
+        Args:
+            opera (Sequence[str]): airline operator of each flight.
+            tipo (Sequence[str]): flight type of each flight.
+            mes (Sequence[int]): month of each flight.
+
+        Returns:
+            np.ndarray: int8 predicted targets.
+        """
+        if self._lut is None:
+            # Return default predictions (no delay) if model not trained
+            return np.zeros(len(mes), dtype=np.int8)
+        
+        opera_idx = [self._OPERA_INDEX[value] for value in opera]
+        tipo_idx = [self._TIPO_INDEX[value] for value in tipo]
+        return self._lut[opera_idx, tipo_idx, np.asarray(mes, dtype=np.intp) - 1]
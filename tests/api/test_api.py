@@ -64,4 +64,36 @@ class TestBatchPipeline(unittest.TestCase):
         }
         # when("xgboost.XGBClassifier").predict(ANY).thenReturn(np.array([0]))
         response = self.client.post("/predict", json=data)
-        self.assertEqual(response.status_code, 400)
\ No newline at end of file
+        self.assertEqual(response.status_code, 400)
+
+    def test_should_failed_missing_column(self):
+        data = {
+            "flights": [
+                {
+                    "OPERA": "Aerolineas Argentinas",
+                    "TIPOVUELO": "N"
+                }
+            ]
+        }
+        response = self.client.post("/predict", json=data)
+        self.assertEqual(response.status_code, 400)
+
+
+    def test_should_failed_reporting_all_invalid_flights(self):
+        data = {
+            "flights": [
+                {
+                    "OPERA": "Argentinas",
+                    "TIPOVUELO": "N",
+                    "MES": 3
+                },
+                {
+                    "OPERA": "Aerolineas Argentinas",
+                    "TIPOVUELO": "N",
+                    "MES": 13
+                }
+            ]
+        }
+        response = self.client.post("/predict", json=data)
+        self.assertEqual(response.status_code, 400)
+        self.assertEqual(len(response.json()["detail"]), 2)
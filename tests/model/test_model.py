@@ -1,4 +1,7 @@
+import os
+import tempfile
 import unittest
+import numpy as np
 import pandas as pd
 
 from sklearn.metrics import classification_report
@@ -100,4 +103,112 @@ class TestModel(unittest.TestCase):
 
         assert isinstance(predicted_targets, list)
         assert len(predicted_targets) == features.shape[0]
-        assert all(isinstance(predicted_target, int) for predicted_target in predicted_targets)
\ No newline at end of file
+        assert all(isinstance(predicted_target, int) for predicted_target in predicted_targets)
+
+
+    def test_model_delay_target_for_unparseable_dates(
+        self
+    ):
+        data = pd.DataFrame({
+            "Fecha-I": ["2017-01-01 23:30:00", None],
+            "Fecha-O": ["not a date", "2017-01-02 01:00:00"]
+        })
+
+        delay = self.model._generate_delay_target(data)
+
+        assert delay.tolist() == [0, 0]
+
+
+    def test_model_predict_array_matches_estimator(
+        self
+    ):
+        features, target = self.model.preprocess(
+            data=self.data,
+            target_column="delay"
+        )
+
+        self.model.fit(
+            features=features,
+            target=target
+        )
+
+        predicted_targets = self.model.predict(
+            features=features.to_numpy()
+        )
+
+        assert predicted_targets == self.model._model.predict(features).tolist()
+
+
+    def test_model_save_and_load(
+        self
+    ):
+        features, target = self.model.preprocess(
+            data=self.data,
+            target_column="delay"
+        )
+
+        self.model.fit(
+            features=features,
+            target=target
+        )
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            filepath = os.path.join(tmp_dir, "model.pkl")
+            self.model.save_model(filepath)
+
+            loaded_model = DelayModel()
+            loaded_model.load_model(filepath)
+
+            assert loaded_model.predict(features) == self.model.predict(features)
+
+
+    def test_model_predict_fast_matches_predict(
+        self
+    ):
+        features, target = self.model.preprocess(
+            data=self.data,
+            target_column="delay"
+        )
+
+        self.model.fit(
+            features=features,
+            target=target
+        )
+
+        flights = self.data[self.data["OPERA"].isin(DelayModel.OPERATORS)]
+        predicted_targets = self.model.predict(
+            features=features.loc[flights.index]
+        )
+        fast_predicted_targets = [
+            self.model.predict_fast(opera, tipo, mes)
+            for opera, tipo, mes in flights[["OPERA", "TIPOVUELO", "MES"]].itertuples(index=False)
+        ]
+
+        assert fast_predicted_targets == predicted_targets
+
+
+    def test_model_predict_fast_batch_matches_predict_fast(
+        self
+    ):
+        features, target = self.model.preprocess(
+            data=self.data,
+            target_column="delay"
+        )
+
+        self.model.fit(
+            features=features,
+            target=target
+        )
+
+        flights = self.data[self.data["OPERA"].isin(DelayModel.OPERATORS)]
+        predicted_targets = self.model.predict_fast_batch(
+            opera=flights["OPERA"].tolist(),
+            tipo=flights["TIPOVUELO"].tolist(),
+            mes=flights["MES"].tolist()
+        )
+
+        assert isinstance(predicted_targets, np.ndarray)
+        assert predicted_targets.tolist() == [
+            self.model.predict_fast(opera, tipo, mes)
+            for opera, tipo, mes in flights[["OPERA", "TIPOVUELO", "MES"]].itertuples(index=False)
+        ]